@@ -19,10 +19,16 @@ To support the developer and ensure you have the latest stable version,
 please download directly from the Official QGIS Repository.
 """
 
+import concurrent.futures
 import csv
+import functools
 import math
 import os
-import re
+import queue
+import struct
+import threading
+
+import numpy as np
 
 from qgis.core import (
     QgsCategorizedSymbolRenderer,
@@ -30,7 +36,6 @@ from qgis.core import (
     QgsField,
     QgsFields,
     QgsGeometry,
-    QgsPointXY,
     QgsProject,
     QgsRendererCategory,
     QgsSymbol,
@@ -50,11 +55,159 @@ from qgis.PyQt.QtGui import (
 from qgis.PyQt.QtWidgets import QAction, QMessageBox, QProgressDialog
 
 
+# Wedge arc is sampled every 3°, a full 360° beam needs 121 arc vertices
+_MAX_ARC_VERTICES = 121
+_WEDGE_BATCH_ROWS = 16384
+
+# Metres per degree of longitude at the equator and of latitude; cos(lat) is floored near the poles
+_M_PER_DEG_LON_EQUATOR = 111320.0
+_M_PER_DEG_LAT = 110540.0
+_MIN_COS_LAT = 1e-6
+
+_WEDGE_CACHE_SIZE = 65536
+_CSV_CHUNK_ROWS = 10000
+_CSV_PREFETCH_CHUNKS = 16
+
+# Sector columns held as float64 arrays, the rest stay Python lists
+_NUMERIC_KEYS = ('_lat', '_lon', '_azim', '_radius', '_beam')
+_SECTOR_KEYS = ('_row', '_site', '_band', '_target_val') + _NUMERIC_KEYS
+
+
+@functools.lru_cache(maxsize=1024)
+def extract_numeric_freq(band_string):
+    """Extracts the operational frequency from band names (e.g., LTE1800 -> 1800)."""
+    # Single-pattern \d+ scan done by hand over ASCII bytes: cheaper than driving the regex engine.
+    # Non-ASCII characters become '?' so they still separate digit runs.
+    best = -1
+    cur = 0
+    in_num = False
+    for c in str(band_string).encode('ascii', 'replace'):
+        if 48 <= c <= 57:
+            cur = cur * 10 + (c - 48)
+            in_num = True
+        elif in_num:
+            if cur > best:
+                best = cur
+            cur = 0
+            in_num = False
+    if in_num and cur > best:
+        best = cur
+    return best if best >= 0 else 99999
+
+
+@functools.lru_cache(maxsize=_MAX_ARC_VERTICES + 2)
+def _kml_coord_template(n_vertices):
+    """Returns a KML coordinate format string for a ring with n_vertices."""
+    return " ".join(["%r,%r,0"] * n_vertices)
+
+
+@functools.lru_cache(maxsize=_MAX_ARC_VERTICES + 2)
+def _polygon_wkb_header(n_vertices):
+    """Returns the little-endian WKB header of a single-ring polygon with n_vertices."""
+    return struct.pack('<BIII', 1, 3, 1, n_vertices)
+
+
+def _column_indices(headers, cols):
+    """Maps each mapped input column to its position in the header (None if absent)."""
+    header_idx = {h: i for i, h in enumerate(headers)}
+    return {key: header_idx.get(name) for key, name in cols.items()}
+
+
+def _prefetch(iterable, depth=_CSV_PREFETCH_CHUNKS):
+    """Yields the items of iterable while a worker thread produces the following ones.
+
+    Lets a producer that releases the GIL (the pandas C tokenizer) run up to depth items ahead of
+    the consumer. Exceptions from the producer are re-raised in the consumer; closing the generator
+    early stops the worker before returning.
+    """
+    items = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+            put((done, None))
+        except Exception as e:
+            put((done, e))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        pool.submit(produce)
+        try:
+            while True:
+                item, error = items.get()
+                if item is done:
+                    if error is not None:
+                        raise error
+                    return
+                yield item
+        finally:
+            stop.set()
+
+
+def _sector_columns(columns):
+    """Converts per-row sector lists into the structure-of-arrays layout used downstream."""
+    return {
+        key: np.asarray(val, dtype=np.float64) if key in _NUMERIC_KEYS else val
+        for key, val in columns.items()
+    }
+
+
+def _take(sectors, order):
+    """Reorders every sector column by the given row permutation."""
+    order_list = order.tolist()
+    return {
+        key: val[order] if isinstance(val, np.ndarray) else [val[i] for i in order_list]
+        for key, val in sectors.items()
+    }
+
+
+def _wedge_vertices(lon, lat, azim, beam, radius, out_x, out_y):
+    """Fills out_x/out_y[i, k] with arc vertex k of wedge i."""
+    steps = np.arange(out_x.shape[1]) * 3.0
+    rad = np.radians(90.0 - ((azim - beam / 2.0)[:, None] + steps))
+    np.multiply(radius[:, None], np.cos(rad), out=out_x)
+    np.multiply(radius[:, None], np.sin(rad), out=out_y)
+    out_x += lon[:, None]
+    out_y += lat[:, None]
+
+
+@functools.lru_cache(maxsize=32)
+def _make_wedge_fn(beam):
+    """Returns an arc builder specialised for one beam width.
+
+    The vertex count is baked in, so every shape sharing the beam is computed into
+    exactly-sized arrays instead of being padded to the widest beam in the dataset.
+    """
+    n_arc = int(min(beam // 3 + 1, _MAX_ARC_VERTICES)) if math.isfinite(beam) and beam >= 0 else 0
+
+    def wedge_fn(azim, radius):
+        out_x = np.empty((len(azim), n_arc))
+        out_y = np.empty((len(azim), n_arc))
+        origin = np.zeros(len(azim))
+        _wedge_vertices(origin, origin, azim, np.full(len(azim), beam), radius, out_x, out_y)
+        return out_x, out_y
+
+    return wedge_fn
+
+
 class SiteSector:
     def __init__(self, iface):
         self.iface = iface
         self.plugin_dir = os.path.dirname(__file__)
         self.action = None
+        self._wedge_cache = {}
 
     def initGui(self):
         icon_path = os.path.join(self.plugin_dir, "icon.png")
@@ -68,32 +221,247 @@ class SiteSector:
             self.iface.removePluginMenu("&Site Sector", self.action)
             self.iface.removeToolBarIcon(self.action)
 
-    def create_wedge_geom(self, lon, lat, azim, beam, radius_m):
-        """Creates a wedge polygon representing a cell sector."""
-        radius_deg = radius_m / 111320.0
-        points = [QgsPointXY(lon, lat)]
-        
-        start_angle = azim - (beam / 2)
-        end_angle = azim + (beam / 2)
-        curr_angle = start_angle
-        
-        while curr_angle <= end_angle:
-            rad = math.radians(90 - curr_angle)
-            points.append(
-                QgsPointXY(
-                    lon + radius_deg * math.cos(rad), 
-                    lat + radius_deg * math.sin(rad)
-                )
+    def create_wedge_geoms(self, lon, lat, azim, beam, radius_m, keep_wkb=False):
+        """Creates wedge polygons for a batch of cell sectors.
+
+        Returns the polygon geometries and, if keep_wkb is set, their WKB bytes (else None).
+        The WKB holds exactly the ring's vertices, unlike the batch buffers padded to the widest beam.
+        """
+        lon = np.asarray(lon, dtype=np.float64)
+        lat = np.asarray(lat, dtype=np.float64)
+        templates, inv = self._wedge_templates(azim, beam, radius_m)
+
+        # Degrees per metre at each site: longitude spacing shrinks with cos(latitude)
+        cos_lat = np.maximum(np.cos(np.radians(lat)), _MIN_COS_LAT)
+        deg_per_m = np.column_stack([1.0 / (_M_PER_DEG_LON_EQUATOR * cos_lat), np.full(len(lat), 1.0 / _M_PER_DEG_LAT)])
+
+        # Pad the unique arc offsets into one gather table
+        arc_len = np.array([len(dx) for dx, _ in templates], dtype=np.int64)
+        max_v = int(arc_len.max()) if len(arc_len) else 0
+        table = np.zeros((len(templates), max_v, 2))
+        for u, (dx, dy) in enumerate(templates):
+            table[u, :len(dx), 0] = dx
+            table[u, :len(dy), 1] = dy
+        n_arc = arc_len[inv]
+
+        geoms = []
+        wkbs = [] if keep_wkb else None
+        for s in range(0, len(lon), _WEDGE_BATCH_ROWS):
+            e = min(s + _WEDGE_BATCH_ROWS, len(lon))
+
+            # Closed rings [center, arc..., center] laid out as (rows, vertices, xy)
+            ring = np.empty((e - s, max_v + 2, 2), dtype='<f8')
+            ring[:, 0, 0] = lon[s:e]
+            ring[:, 0, 1] = lat[s:e]
+            ring[:, 1:max_v + 1] = ring[:, :1] + table[inv[s:e]] * deg_per_m[s:e, None, :]
+            ring[np.arange(e - s), n_arc[s:e] + 1] = ring[:, 0]
+
+            for i, k in enumerate(n_arc[s:e].tolist()):
+                wkb = _polygon_wkb_header(k + 2) + ring[i, :k + 2].tobytes()
+                geom = QgsGeometry()
+                geom.fromWkb(wkb)
+                geoms.append(geom)
+                if keep_wkb:
+                    wkbs.append(wkb)
+        return geoms, wkbs
+
+    def _wedge_templates(self, azim, beam, radius_m):
+        """Returns the arc offsets of each unique (azim, beam, radius) and the row -> template index.
+
+        Offsets are in metres relative to the site position and memoized across runs, so a dataset
+        with a handful of standard sector shapes only evaluates the trig kernel for those shapes.
+        """
+        keys = np.round(np.column_stack([
+            np.asarray(azim, dtype=np.float64),
+            np.asarray(beam, dtype=np.float64),
+            np.asarray(radius_m, dtype=np.float64)
+        ]), 2)
+        uniq, inv = np.unique(keys, axis=0, return_inverse=True)
+        uniq_keys = [tuple(k) for k in uniq.tolist()]
+
+        missing = [u for u, key in enumerate(uniq_keys) if key not in self._wedge_cache]
+        computed = {}
+        if missing:
+            if len(self._wedge_cache) + len(missing) > _WEDGE_CACHE_SIZE:
+                self._wedge_cache.clear()
+                missing = list(range(len(uniq_keys)))
+
+            # Shapes sharing a beam width go through that beam's specialised builder
+            by_beam = {}
+            for u in missing:
+                by_beam.setdefault(uniq_keys[u][1], []).append(u)
+
+            for beam_w, group in by_beam.items():
+                dx, dy = _make_wedge_fn(beam_w)(uniq[group, 0], uniq[group, 2])
+                for j, u in enumerate(group):
+                    computed[u] = (dx[j], dy[j])
+                    if np.isfinite(uniq[u]).all():
+                        self._wedge_cache[uniq_keys[u]] = computed[u]
+
+        templates = [computed[u] if u in computed else self._wedge_cache[key] for u, key in enumerate(uniq_keys)]
+        return templates, inv.reshape(-1)
+
+    def read_sectors(self, inputs, is_pci_mode, progress):
+        """Reads the input CSV into sector columns.
+
+        Returns (headers, sectors, unique_bands, site_coords), or None if the user cancelled.
+        site_coords maps each site to the (lon, lat) of its first valid row.
+        """
+        with open(inputs.file_path, 'r', encoding='utf-8-sig', newline='') as f:
+            all_headers = next(csv.reader(f), [])
+
+        # Rows cannot be parsed at all when a mapped column is missing from the header
+        idx = _column_indices(all_headers, inputs.cols)
+        required = ['site', 'lat', 'lon', 'azim', 'pci' if is_pci_mode else 'band']
+        required += [k for k in ('radius', 'beam') if inputs.cols[k] != "-- Use Manual --"]
+        if any(idx[k] is None for k in required):
+            return all_headers, _sector_columns({k: [] for k in _SECTOR_KEYS}), set(), {}
+
+        # Imported here rather than at module load: QGIS imports the plugin at startup
+        try:
+            import pandas as pd
+        except ImportError:
+            pd = None
+
+        if pd is not None:
+            try:
+                return self._read_sectors_pandas(inputs, is_pci_mode, progress, all_headers, idx)
+            except pd.errors.ParserError:
+                pass  # Ragged rows, fall back to the tolerant stdlib reader
+        return self._read_sectors_csv(inputs, is_pci_mode, progress, all_headers, idx)
+
+    def _read_sectors_pandas(self, inputs, is_pci_mode, progress, all_headers, idx):
+        """Parses the CSV in C with pandas and converts numeric columns a chunk at a time."""
+        import pandas as pd
+
+        total_bytes = max(os.path.getsize(inputs.file_path), 1)
+        use_manual_radius = (inputs.cols['radius'] == "-- Use Manual --")
+        use_manual_beam = (inputs.cols['beam'] == "-- Use Manual --")
+        mod_type = inputs.pci_params['mod_type']
+
+        columns = {k: [] for k in _SECTOR_KEYS}
+        unique_bands = set()
+        site_coords = {}
+        with open(inputs.file_path, 'rb', buffering=1 << 20) as f:
+            reader = pd.read_csv(
+                f, encoding='utf-8-sig', dtype=str, na_filter=False,
+                index_col=False, chunksize=_CSV_CHUNK_ROWS
             )
-            curr_angle += 3 
+            # Tokenize the next chunks in the background while this thread converts the current one
+            for chunk in _prefetch(reader):
+                if progress.wasCanceled():
+                    return None
+                progress.setValue(min(int(f.tell() * 100 / total_bytes), 99))
+                chunk = chunk.fillna("")
+                n = len(chunk)
+
+                def numeric(key):
+                    return pd.to_numeric(chunk.iloc[:, idx[key]], errors='coerce').to_numpy(dtype=np.float64)
+
+                lat, lon, azim = numeric('lat'), numeric('lon'), numeric('azim')
+                radius = np.full(n, np.nan) if use_manual_radius else numeric('radius')
+                beam = np.full(n, inputs.manual['beam']) if use_manual_beam else numeric('beam')
+                valid = np.isfinite(lat) & np.isfinite(lon) & np.isfinite(azim) & np.isfinite(beam)
+                if not use_manual_radius:
+                    valid &= np.isfinite(radius)
+
+                bands = chunk.iloc[:, idx['band']].str.strip().tolist() if idx['band'] is not None else [""] * n
+                unique_bands.update(b for b in set(bands) if b)
+
+                if is_pci_mode:
+                    pci = numeric('pci')
+                    valid &= np.isfinite(pci)
+                    targets = np.zeros(n, dtype=np.int64)
+                    targets[valid] = np.trunc(pci[valid]).astype(np.int64) % mod_type
+                    targets = [str(t) for t in targets.tolist()]
+                else:
+                    targets = bands
+
+                keep = np.flatnonzero(valid).tolist()
+                rows = chunk.to_numpy(dtype=object).tolist()
+                sites = chunk.iloc[:, idx['site']].tolist()
+                kept_sites = [sites[j] for j in keep]
+                for site, x, y in zip(kept_sites, lon[valid].tolist(), lat[valid].tolist()):
+                    if site not in site_coords:
+                        site_coords[site] = (x, y)
+
+                columns['_row'].extend([rows[j] for j in keep])
+                columns['_site'].extend(kept_sites)
+                columns['_band'].extend([bands[j] for j in keep])
+                columns['_target_val'].extend([targets[j] for j in keep])
+                for key, arr in (('_lat', lat), ('_lon', lon), ('_azim', azim), ('_radius', radius), ('_beam', beam)):
+                    columns[key].append(arr[valid])
+
+        for key in _NUMERIC_KEYS:
+            columns[key] = np.concatenate(columns[key]) if columns[key] else []
+        return all_headers, _sector_columns(columns), unique_bands, site_coords
+
+    def _read_sectors_csv(self, inputs, is_pci_mode, progress, all_headers, idx):
+        """Parses the CSV row by row with the stdlib reader."""
+        total_bytes = max(os.path.getsize(inputs.file_path), 1)
+        use_manual_radius = (inputs.cols['radius'] == "-- Use Manual --")
+        n_cols = len(all_headers)
+
+        columns = {k: [] for k in _SECTOR_KEYS}
+        unique_bands = set()
+        site_coords = {}
+        with open(inputs.file_path, 'r', encoding='utf-8-sig', buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            next(reader, None)
             
-        points.append(QgsPointXY(lon, lat))
-        return QgsGeometry.fromPolygonXY([points])
+            for i, row in enumerate(reader):
+                # Qt calls are costly per row: progress every 1024 rows, cancel checks every 4096
+                if not i & 0x3FF:
+                    progress.setValue(min(int(f.buffer.tell() * 100 / total_bytes), 99))
+                    if not i & 0xFFF and progress.wasCanceled():
+                        return None
+                if len(row) != n_cols:
+                    row = (row + [""] * n_cols)[:n_cols]
+
+                band_val = row[idx['band']].strip() if idx['band'] is not None else ""
+                if band_val:
+                    unique_bands.add(band_val)
+                    
+                try:
+                    # Radius is resolved after the pass once all band ranks are known
+                    radius = np.nan if use_manual_radius else float(row[idx['radius']])
+                        
+                    # Beam processing
+                    beam_col = inputs.cols['beam']
+                    beam = inputs.manual['beam'] if beam_col == "-- Use Manual --" else float(row[idx['beam']])
+                    
+                    lat = float(row[idx['lat']])
+                    lon = float(row[idx['lon']])
+                    azim = float(row[idx['azim']])
+                    # Same acceptance as the pandas path: non-finite values ('nan', 'inf') drop the row
+                    if not (math.isfinite(lat) and math.isfinite(lon) and math.isfinite(azim) and math.isfinite(beam)
+                            and (use_manual_radius or math.isfinite(radius))):
+                        continue
+                    
+                    # Target classification
+                    if not is_pci_mode:
+                        target_val = band_val
+                    else:
+                        pci_val = float(row[idx['pci']])
+                        target_val = str(int(pci_val) % inputs.pci_params['mod_type'])
+                        
+                except (ValueError, KeyError, TypeError, OverflowError):
+                    continue 
 
-    def extract_numeric_freq(self, band_string):
-        """Extracts the operational frequency from band names (e.g., LTE1800 -> 1800)."""
-        nums = re.findall(r'\d+', str(band_string))
-        return max(int(n) for n in nums) if nums else 99999
+                site = row[idx['site']]
+                if site not in site_coords:
+                    site_coords[site] = (lon, lat)
+
+                columns['_row'].append(row)
+                columns['_site'].append(site)
+                columns['_lat'].append(lat)
+                columns['_lon'].append(lon)
+                columns['_azim'].append(azim)
+                columns['_radius'].append(radius)
+                columns['_beam'].append(beam)
+                columns['_band'].append(band_val)
+                columns['_target_val'].append(target_val)
+        return all_headers, _sector_columns(columns), unique_bands, site_coords
 
     def run(self):
         from .site_sector_dialog import SiteSectorDialog
@@ -105,130 +473,83 @@ class SiteSector:
         inputs = dlg.get_inputs()
         
         # Validate mandatory mappings
-        required_cols = [inputs['cols']['lat'], inputs['cols']['lon'], inputs['cols']['azim']]
+        required_cols = [inputs.cols['lat'], inputs.cols['lon'], inputs.cols['azim']]
         if "-- Select Column --" in required_cols:
             QMessageBox.warning(None, "Mapping Error", "Latitude, Longitude, and Azimuth columns are required.")
             return
             
-        is_pci_mode = (inputs['active_tab'] == 1)
+        is_pci_mode = (inputs.active_tab == 1)
         
-        if is_pci_mode and inputs['cols']['pci'] == "-- Select Column --":
+        if is_pci_mode and inputs.cols['pci'] == "-- Select Column --":
             QMessageBox.warning(None, "PCI Mapping", "Please select the PCI Column in Tab 2.")
             return
             
-        if not is_pci_mode and inputs['cols']['band'] == "-- Select Column --":
+        if not is_pci_mode and inputs.cols['band'] == "-- Select Column --":
             QMessageBox.warning(None, "Band Mapping", "Please select the Band/Freq Column in Tab 1.")
             return
 
-        # Prepare dataset and determine unique bands for auto-decrement radius logic
-        sorted_bands_list = []
-        if inputs['cols']['band'] != "-- Select Column --":
-            unique_bands_temp = set()
-            try:
-                with open(inputs['file_path'], 'r', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if val := row.get(inputs['cols']['band']):
-                            unique_bands_temp.add(str(val).strip())
-                sorted_bands_list = sorted(list(unique_bands_temp), key=self.extract_numeric_freq)
-            except IOError as e:
-                QMessageBox.critical(None, "File Error", f"Cannot read input file:\n{e}")
-                return
-
-        # Estimate rows for progress dialog
-        try:
-            with open(inputs['file_path'], 'r', encoding='utf-8-sig') as f:
-                total_rows = sum(1 for _ in f) - 1
-        except Exception:
-            total_rows = 1000 
-            
-        progress = QProgressDialog("Generating Sectors...", "Cancel", 0, total_rows, self.iface.mainWindow())
+        progress = QProgressDialog("Generating Sectors...", "Cancel", 0, 100, self.iface.mainWindow())
         progress.setWindowTitle("Processing Data")
         progress.setWindowModality(Qt.WindowModal)
         progress.setMinimumDuration(0)
 
-        data_list = []
-        all_headers = []
-        
-        # Process CSV data
-        with open(inputs['file_path'], 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            all_headers = reader.fieldnames
-            
-            for i, row in enumerate(reader):
-                if progress.wasCanceled():
-                    QMessageBox.information(None, "Cancelled", "Process cancelled by user.")
-                    return
-                if i % 1000 == 0: 
-                    progress.setValue(i)
-                    
-                try:
-                    # Radius processing with overlap decrement handling
-                    rad_col = inputs['cols']['radius']
-                    if rad_col == "-- Use Manual --":
-                        base_rad = inputs['manual']['radius']
-                        band_val = str(row.get(inputs['cols']['band'], "")).strip()
-                        if band_val in sorted_bands_list:
-                            rank = sorted_bands_list.index(band_val)
-                            radius = max(base_rad - (rank * 20), 10) 
-                        else: 
-                            radius = base_rad
-                    else: 
-                        radius = float(row[rad_col])
-                        
-                    # Beam processing
-                    beam_col = inputs['cols']['beam']
-                    beam = inputs['manual']['beam'] if beam_col == "-- Use Manual --" else float(row[beam_col])
-                    
-                    row_data = dict(row)
-                    row_data['_site'] = str(row[inputs['cols']['site']])
-                    row_data['_lat'] = float(row[inputs['cols']['lat']])
-                    row_data['_lon'] = float(row[inputs['cols']['lon']])
-                    row_data['_azim'] = float(row[inputs['cols']['azim']])
-                    row_data['_radius'] = radius
-                    row_data['_beam'] = beam
-                    
-                    # Target classification
-                    if not is_pci_mode:
-                        row_data['_target_val'] = str(row[inputs['cols']['band']]).strip()
-                    else:
-                        pci_val = float(row[inputs['cols']['pci']])
-                        row_data['_target_val'] = str(int(pci_val) % inputs['pci_params']['mod_type'])
-                        
-                    row_data['_geom'] = self.create_wedge_geom(
-                        row_data['_lon'], row_data['_lat'], 
-                        row_data['_azim'], row_data['_beam'], row_data['_radius']
-                    )
-                    data_list.append(row_data)
-                    
-                except (ValueError, KeyError, TypeError):
-                    continue 
+        # Single streaming pass: collect rows and unique bands for the auto-decrement radius logic
+        try:
+            result = self.read_sectors(inputs, is_pci_mode, progress)
+        except IOError as e:
+            QMessageBox.critical(None, "File Error", f"Cannot read input file:\n{e}")
+            return
+
+        if result is None:
+            QMessageBox.information(None, "Cancelled", "Process cancelled by user.")
+            return
+
+        all_headers, sectors, unique_bands, site_coords = result
+        n_sectors = len(sectors['_row'])
+        use_manual_radius = (inputs.cols['radius'] == "-- Use Manual --")
+        progress.setValue(100)
 
-        progress.setValue(total_rows)
+        # Radius processing with overlap decrement handling
+        if use_manual_radius:
+            sorted_bands_list = sorted(unique_bands, key=extract_numeric_freq)
+            band_rank = {b: i for i, b in enumerate(sorted_bands_list)}
+            base_rad = inputs.manual['radius']
+            ranks = np.array([band_rank.get(b, -1) for b in sectors['_band']], dtype=np.float64)
+            sectors['_radius'] = np.where(ranks >= 0, np.maximum(base_rad - (ranks * 20), 10), base_rad)
 
-        if not data_list:
+        if not n_sectors:
             QMessageBox.warning(None, "Data Error", "No valid sectors could be generated from the dataset.")
             return
 
         # Sort data for proper rendering stack
         if not is_pci_mode:
-            data_list.sort(key=lambda x: self.extract_numeric_freq(x['_target_val']))
+            sort_keys = [extract_numeric_freq(t) for t in sectors['_target_val']]
         else:
-            data_list.sort(key=lambda x: int(x['_target_val']))
+            sort_keys = [int(t) for t in sectors['_target_val']]
+        sectors = _take(sectors, np.argsort(np.array(sort_keys), kind='stable'))
+
+        # Build all wedge geometries in one batch; only the KML writer needs the raw rings
+        export_kml = bool(inputs.save_path) and "kml" in inputs.format.lower()
+        sectors['_geom'], sectors['_wkb'] = self.create_wedge_geoms(
+            sectors['_lon'], sectors['_lat'], sectors['_azim'], sectors['_beam'], sectors['_radius'],
+            keep_wkb=export_kml
+        )
 
         # Initialize vector layer
         layer_name = "Site_Sector_PCI_Audit" if is_pci_mode else "Site_Sector"
         vl = QgsVectorLayer("Polygon?crs=EPSG:4326", layer_name, "memory")
         pr = vl.dataProvider()
         
+        # Duplicate header names map to a single field holding the last column's value
+        attr_cols = list({h: i for i, h in enumerate(all_headers)}.values())
         fields = QgsFields()
-        for h in all_headers: 
-            fields.append(QgsField(h, QVariant.String))
+        for i in attr_cols: 
+            fields.append(QgsField(all_headers[i], QVariant.String))
         fields.append(QgsField("Gen_Radius", QVariant.Double))
         fields.append(QgsField("Gen_Beam", QVariant.Double))
         
         if is_pci_mode: 
-            fields.append(QgsField(f"Mod_{inputs['pci_params']['mod_type']}", QVariant.Int))
+            fields.append(QgsField(f"Mod_{inputs.pci_params['mod_type']}", QVariant.Int))
             
         pr.addAttributes(fields)
         vl.updateFields()
@@ -238,39 +559,42 @@ class SiteSector:
         progress.setValue(0)
         
         features_to_add = []
-        for row_data in data_list:
+        sector_iter = zip(
+            sectors['_row'], sectors['_radius'].tolist(), sectors['_beam'].tolist(),
+            sectors['_target_val'], sectors['_geom']
+        )
+        for row, radius, beam, target, geom in sector_iter:
             fet = QgsFeature(fields)
-            for h in all_headers: 
-                fet.setAttribute(h, str(row_data[h]))
-                
-            fet.setAttribute("Gen_Radius", row_data['_radius'])
-            fet.setAttribute("Gen_Beam", row_data['_beam'])
+            attrs = [row[i] for i in attr_cols]
+            attrs.append(radius)
+            attrs.append(beam)
             
             if is_pci_mode: 
-                fet.setAttribute(f"Mod_{inputs['pci_params']['mod_type']}", int(row_data['_target_val']))
+                attrs.append(int(target))
                 
-            fet.setGeometry(row_data['_geom'])
+            fet.setAttributes(attrs)
+            fet.setGeometry(geom)
             features_to_add.append(fet)
             
         pr.addFeatures(features_to_add) 
         vl.updateExtents()
-        progress.setValue(total_rows)
+        progress.setValue(100)
 
         # Apply symbology
         categories = []
         unique_targets = sorted(
-            list(set(d['_target_val'] for d in data_list)), 
-            key=lambda x: self.extract_numeric_freq(x) if not is_pci_mode else int(x)
+            set(sectors['_target_val']), 
+            key=lambda x: extract_numeric_freq(x) if not is_pci_mode else int(x)
         )
-        opacity_float = (inputs['pci_params']['opacity'] if is_pci_mode else inputs['band_params']['opacity']) / 100.0
+        opacity_float = (inputs.pci_params['opacity'] if is_pci_mode else inputs.band_params['opacity']) / 100.0
         final_colors_map = {} 
         
         for target in unique_targets:
             if not is_pci_mode: 
-                col_hex = inputs['band_params']['colors'].get(target, "#888888")
+                col_hex = inputs.band_params['colors'].get(target, "#888888")
             else:
                 idx = int(target)
-                col_hex = inputs['pci_params']['colors'][idx] if idx < 6 else "#888888"
+                col_hex = inputs.pci_params['colors'][idx] if idx < 6 else "#888888"
             
             final_colors_map[target] = col_hex
             symbol = QgsSymbol.defaultSymbol(vl.geometryType())
@@ -280,14 +604,14 @@ class SiteSector:
             label = f"Mod {target}" if is_pci_mode else str(target)
             categories.append(QgsRendererCategory(target, symbol, label))
 
-        target_field = f"Mod_{inputs['pci_params']['mod_type']}" if is_pci_mode else inputs['cols']['band']
+        target_field = f"Mod_{inputs.pci_params['mod_type']}" if is_pci_mode else inputs.cols['band']
         vl.setRenderer(QgsCategorizedSymbolRenderer(target_field, categories))
         QgsProject.instance().addMapLayer(vl)
 
         # Export handling
-        save_path = inputs['save_path']
+        save_path = inputs.save_path
         if save_path:
-            fmt = inputs['format'].lower()
+            fmt = inputs.format.lower()
             options = QgsVectorFileWriter.SaveVectorOptions()
             options.fileEncoding = "UTF-8"
             options.symbologyExport = QgsVectorFileWriter.FeatureSymbology
@@ -303,13 +627,13 @@ class SiteSector:
                 QgsVectorFileWriter.writeAsVectorFormatV2(vl, save_path, QgsProject.instance().transformContext(), options)
                 
             elif "kml" in fmt:
-                self.export_to_kml(data_list, inputs, save_path, all_headers, unique_targets, final_colors_map, is_pci_mode)
+                self.export_to_kml(sectors, site_coords, inputs, save_path, all_headers, unique_targets, final_colors_map, is_pci_mode)
 
             QDesktopServices.openUrl(QUrl.fromLocalFile(os.path.dirname(save_path)))
 
-        QMessageBox.information(None, "Success", f"Successfully generated {len(data_list)} site sectors.")
+        QMessageBox.information(None, "Success", f"Successfully generated {n_sectors} site sectors.")
 
-    def export_to_kml(self, data, params, output_path, headers, sorted_targets, colors_map, is_pci_mode):
+    def export_to_kml(self, sectors, site_coords, params, output_path, headers, sorted_targets, colors_map, is_pci_mode):
         """Generates a styled KML file with a dynamic floating legend."""
         
         def hex_to_kml_color(hex_str, opacity_pct):
@@ -340,86 +664,90 @@ class SiteSector:
             
             font.setBold(False)
             painter.setFont(font)
-            y_pos = 30
-            
-            for t in legend_items:
-                hex_col = colors_map.get(t, "#888888")
+
+            # Group swatches by colour so each brush is set once and drawn in one drawRects call
+            swatches = {}
+            for i, t in enumerate(legend_items):
+                swatches.setdefault(colors_map.get(t, "#888888"), []).append(QRect(10, 30 + i * 25, 20, 15))
+            for hex_col, rects in swatches.items():
                 painter.setBrush(QBrush(QColor(hex_col)))
-                painter.drawRect(10, y_pos, 20, 15)
+                painter.drawRects(rects)
+
+            for i, t in enumerate(legend_items):
                 lbl_text = f"Mod {t}" if is_pci_mode else str(t)
-                painter.drawText(40, y_pos + 12, lbl_text)
-                y_pos += 25
+                painter.drawText(40, 30 + i * 25 + 12, lbl_text)
             
             painter.end()
             img.save(os.path.join(output_dir, "legend.png"))
 
             # Generate KML Document
             doc_name = "Site Sector PCI Audit" if is_pci_mode else "Site Sector"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-                f.write('<kml xmlns="http://www.opengis.net/kml/2.2">\n<Document>\n')
-                f.write(f'  <name>{doc_name}</name>\n')
-                
-                overlay = (
-                    '  <ScreenOverlay><name>Legend Overlay</name>'
-                    '<Icon><href>legend.png</href></Icon>'
-                    '<overlayXY x="0" y="1" xunits="fraction" yunits="fraction"/>'
-                    '<screenXY x="0.02" y="0.98" xunits="fraction" yunits="fraction"/>'
-                    '<size x="0" y="0" xunits="pixels" yunits="pixels"/></ScreenOverlay>\n'
+            parts = [
+                '<?xml version="1.0" encoding="UTF-8"?>\n',
+                '<kml xmlns="http://www.opengis.net/kml/2.2">\n<Document>\n',
+                f'  <name>{doc_name}</name>\n',
+                '  <ScreenOverlay><name>Legend Overlay</name>'
+                '<Icon><href>legend.png</href></Icon>'
+                '<overlayXY x="0" y="1" xunits="fraction" yunits="fraction"/>'
+                '<screenXY x="0.02" y="0.98" xunits="fraction" yunits="fraction"/>'
+                '<size x="0" y="0" xunits="pixels" yunits="pixels"/></ScreenOverlay>\n'
+            ]
+            out = parts.append
+
+            # Site Placemarks, deduplicated during CSV ingest
+            for site, coords in site_coords.items():
+                out(
+                    f'  <Placemark><name>{escape_xml(site)}</name>'
+                    f'<Style><IconStyle><scale>0</scale></IconStyle>'
+                    f'<LabelStyle><color>ff00ffff</color><scale>0.8</scale></LabelStyle></Style>'
+                    f'<Point><coordinates>{coords[0]},{coords[1]},0</coordinates></Point></Placemark>\n'
                 )
-                f.write(overlay)
-
-                # Collect unique site coordinates for Placemarks
-                site_coords = {}
-                for row_data in data:
-                    site_name = row_data.get(params['cols']['site'], "Unknown")
-                    if site_name not in site_coords: 
-                        site_coords[site_name] = (row_data['_lon'], row_data['_lat'])
+
+            opacity_val = params.pci_params['opacity'] if is_pci_mode else params.band_params['opacity']
+            kml_colors = {t: hex_to_kml_color(c, opacity_val) for t, c in colors_map.items()}
+            default_kml_col = hex_to_kml_color("#888888", opacity_val)
+
+            # Templates are formatted once and reused for every sector
+            data_prefixes = [f'      <Data name="{escape_xml(h)}"><value>' for h in headers]
+            placemark_tpl = (
+                '  <Placemark>\n'
+                '    <name>{name}</name>\n'
+                '    <ExtendedData>\n'
+                '{data}'
+                '    </ExtendedData>\n'
+                '    <Style><LineStyle><color>ff000000</color><width>1</width></LineStyle>'
+                '<PolyStyle><color>{color}</color></PolyStyle></Style>\n'
+                '    <Polygon><outerBoundaryIs><LinearRing>'
+                '<coordinates>{coords}</coordinates>'
+                '</LinearRing></outerBoundaryIs></Polygon>\n'
+                '  </Placemark>\n'
+            )
+
+            # Build sector polygons
+            for site_name, target, row, wkb in zip(sectors['_site'], sectors['_target_val'], sectors['_row'], sectors['_wkb']):
+                # Ring coordinates follow the 13-byte single-ring polygon WKB header
+                xy = np.frombuffer(wkb, dtype='<f8', offset=13)
+                coord_str = _kml_coord_template(len(xy) // 2) % tuple(xy.tolist())
                 
-                for site, coords in site_coords.items():
-                    f.write(
-                        f'  <Placemark><name>{escape_xml(site)}</name>'
-                        f'<Style><IconStyle><scale>0</scale></IconStyle>'
-                        f'<LabelStyle><color>ff00ffff</color><scale>0.8</scale></LabelStyle></Style>'
-                        f'<Point><coordinates>{coords[0]},{coords[1]},0</coordinates></Point></Placemark>\n'
-                    )
-
-                opacity_val = params['pci_params']['opacity'] if is_pci_mode else params['band_params']['opacity']
-
-                # Build sector polygons
-                for row_data in data:
-                    hex_col = colors_map.get(row_data['_target_val'], "#888888")
-                    kml_col = hex_to_kml_color(hex_col, opacity_val)
-                    poly = row_data['_geom'].asPolygon()[0]
-                    coord_str = " ".join([f"{pt.x()},{pt.y()},0" for pt in poly])
-                    
-                    site_name = escape_xml(row_data.get(params["cols"]["site"], "Unknown"))
-                    target_lbl = f"Mod_{row_data['_target_val']}" if is_pci_mode else row_data['_target_val']
-                    
-                    f.write('  <Placemark>\n')
-                    f.write(f'    <name>{site_name}_{escape_xml(target_lbl)}</name>\n')
-                    f.write('    <ExtendedData>\n')
-                    
-                    for h in headers:
-                        val = escape_xml(row_data.get(h, ""))
-                        f.write(f'      <Data name="{escape_xml(h)}"><value>{val}</value></Data>\n')
-                        
-                    if is_pci_mode:
-                        f.write(f'      <Data name="Modulo_Result"><value>{row_data["_target_val"]}</value></Data>\n')
-                        
-                    f.write('    </ExtendedData>\n')
-                    f.write(
-                        f'    <Style><LineStyle><color>ff000000</color><width>1</width></LineStyle>'
-                        f'<PolyStyle><color>{kml_col}</color></PolyStyle></Style>\n'
-                    )
-                    f.write(
-                        f'    <Polygon><outerBoundaryIs><LinearRing>'
-                        f'<coordinates>{coord_str}</coordinates>'
-                        f'</LinearRing></outerBoundaryIs></Polygon>\n'
-                    )
-                    f.write('  </Placemark>\n')
-
-                f.write('</Document>\n</kml>')
+                target_lbl = f"Mod_{target}" if is_pci_mode else target
+                ext_data = "".join([
+                    f'{prefix}{escape_xml(val)}</value></Data>\n'
+                    for prefix, val in zip(data_prefixes, row)
+                ])
+                if is_pci_mode:
+                    ext_data += f'      <Data name="Modulo_Result"><value>{target}</value></Data>\n'
+
+                out(placemark_tpl.format_map({
+                    'name': f"{escape_xml(site_name)}_{escape_xml(target_lbl)}",
+                    'data': ext_data,
+                    'color': kml_colors.get(target, default_kml_col),
+                    'coords': coord_str
+                }))
+
+            out('</Document>\n</kml>')
+
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(''.join(parts))
                 
         except Exception as e:
             QMessageBox.critical(None, "KML Export Error", str(e))
\ No newline at end of file
@@ -21,19 +21,258 @@ please download directly from the Official QGIS Repository.
 
 
 import csv
+import mmap
 import os
-import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from sys import intern
 
 from qgis.PyQt import QtWidgets
-from qgis.PyQt.QtCore import Qt
+from qgis.PyQt.QtCore import QCoreApplication, QEvent, QObject, Qt, QThread, pyqtSignal, pyqtSlot
+from qgis.PyQt.QtGui import QColor, QStandardItem, QStandardItemModel
 from qgis.PyQt.QtWidgets import QMessageBox
 from qgis.gui import QgsCollapsibleGroupBox, QgsColorButton, QgsFileWidget
 
+from .site_sector import extract_numeric_freq
+
+# Upper bounds for the band column scan, so huge files do not stall the dialog
+_BAND_SCAN_MAX_ROWS = 200_000
+_BAND_SCAN_MAX_UNIQUE = 64
+# Files above this size are scanned with pyarrow's multithreaded reader when it is available
+_ARROW_SCAN_MIN_BYTES = 50 * 1024 * 1024
+# Number of file versions whose header and band scans are kept in memory
+_SCAN_CACHE_SIZE = 4
+
+_ABOUT_HTML = (
+    "<h3>Site Sector Generator</h3>"
+    "<b>Version:</b> 1.2.0<br>"
+    "<b>Author:</b> Jujun Junaedi<br><br>"
+    "<b>☕ Support & Donate:</b><br>"
+    "If this tool saves you hours of work, consider buying me a coffee!<br>"
+    "• <b>Global:</b> Buy Me a Coffee (buymeacoffee.com/juneth)<br>"
+    "• <b>Indonesia:</b> OVO / GoPay (081510027058)<br><br>"
+    "<div style='background-color: #e8f4f8; padding: 10px; border-radius: 5px; text-align: center; color: #2d98da; border: 1px solid #bdc3c7;'>"
+    "<b>💡 PRO TIP FOR SHARING 💡</b><br>"
+    "<span style='font-size: 11px;'>"
+    "To ensure your colleagues get the latest version without bugs, please share the <b>Official QGIS Plugin Link</b> or <b>GitHub Link</b> instead of raw ZIP files.<br><br>"
+    "<i>Biar rekan kerjamu selalu dapat versi terbaru yang bebas error, yuk biasakan share link resmi QGIS/GitHub, bukan bagi-bagi file ZIP mentahan 😉</i>"
+    "</span>"
+    "</div><br><hr>"
+    "<p align='center' style='color: #636e72; font-size: 11px;'>"
+    "<i>\"Thanks for Taink | Cemot | Bolu | Nara. ❤️❤️❤️❤️\"</i></p>"
+)
+
+_DEFAULT_PCI_COLORS = [Qt.red, Qt.yellow, Qt.blue, Qt.green, Qt.magenta, Qt.cyan]
+
+
+def _read_csv_header(path):
+    """Returns the column names on the first line of a CSV file."""
+    try:
+        # Map the file and slice up to the first newline: no buffered text reader for one line
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            nl = mm.find(b'\n')
+            raw = mm[:nl if nl >= 0 else len(mm)]
+    except (OSError, ValueError):
+        # Empty files and unmappable sources: a modest buffer, since only the first line is read
+        with open(path, 'r', encoding='utf-8-sig', buffering=65536) as f:
+            line = f.readline()
+    else:
+        line = raw.decode('utf-8-sig')
+
+    # Only the first line is needed; the csv module is kept for quoted headers
+    if not line:
+        return []
+    if '"' in line:
+        return next(csv.reader([line]))
+    return line.rstrip('\r\n').split(',')
+
+
+def _scan_band_values(path, col_name, cancelled):
+    """Collects the distinct non-empty values of col_name, within the band scan caps.
+
+    Returns (frozenset of interned values, rows_read, truncated), or None if the scan was cancelled.
+    A missing column yields an empty result.
+    """
+    with open(path, 'r', encoding='utf-8-sig', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # Last occurrence wins on duplicate headers, as in the sector reader
+        idx = {h: i for i, h in enumerate(header)}.get(col_name)
+        if idx is None:
+            return frozenset(), 0, False
+
+        # Arrow resolves a duplicated header to its first column, so duplicated columns stay on the csv path
+        if os.path.getsize(path) > _ARROW_SCAN_MIN_BYTES and header.count(col_name) == 1:
+            # Imported here rather than at module load: only large files take this path
+            try:
+                import pyarrow as pa
+            except ImportError:
+                pa = None
+            if pa is not None:
+                try:
+                    return _scan_band_values_arrow(path, col_name, cancelled)
+                except pa.ArrowException:
+                    pass
+
+        unique_bands = set()
+        rows_read = 0
+        truncated = False
+        for rows_read, row in enumerate(reader, 1):
+            if len(row) > idx and (val := row[idx].strip()) and val not in unique_bands:
+                unique_bands.add(intern(val))
+            if len(unique_bands) >= _BAND_SCAN_MAX_UNIQUE or rows_read >= _BAND_SCAN_MAX_ROWS:
+                truncated = next(reader, None) is not None
+                break
+            if not rows_read & 0xFFF and cancelled():
+                return None
+    return frozenset(unique_bands), rows_read, truncated
+
+
+def _scan_band_values_arrow(path, col_name, cancelled):
+    """Arrow variant of _scan_band_values: streams the column in record batches under the same caps."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pac
+
+    reader = pac.open_csv(
+        path,
+        read_options=pac.ReadOptions(use_threads=True),
+        convert_options=pac.ConvertOptions(
+            include_columns=[col_name], column_types={col_name: pa.string()}, strings_can_be_null=False
+        ),
+    )
+    unique_bands = set()
+    rows_read = 0
+    for batch in reader:
+        if cancelled():
+            return None
+        if not batch.num_rows:
+            continue
+        if len(unique_bands) >= _BAND_SCAN_MAX_UNIQUE or rows_read >= _BAND_SCAN_MAX_ROWS:
+            return frozenset(unique_bands), rows_read, True
+
+        values = pc.utf8_trim_whitespace(batch.column(0)[:_BAND_SCAN_MAX_ROWS - rows_read])
+        # pc.unique keeps first-seen order, so the cap keeps the same bands the row loop would
+        found = pc.unique(pc.filter(values, pc.not_equal(values, ""))).to_pylist()
+        new = [v for v in found if v not in unique_bands][:_BAND_SCAN_MAX_UNIQUE - len(unique_bands)]
+        unique_bands.update(intern(v) for v in new)
+        if len(unique_bands) >= _BAND_SCAN_MAX_UNIQUE:
+            # Stop at the row that completed the cap, as the row loop does
+            values = values[:pc.index(values, new[-1]).as_py() + 1]
+
+        rows_read += len(values)
+        if len(values) < batch.num_rows:
+            return frozenset(unique_bands), rows_read, True
+    return frozenset(unique_bands), rows_read, False
+
+
+@dataclass(frozen=True)
+class SiteSectorInputs:
+    """Immutable snapshot of the dialog settings consumed by the generator."""
+
+    # Declared by hand rather than slots=True, which needs Python 3.10
+    __slots__ = (
+        'file_path', 'cols', 'manual', 'active_tab', 'band_params', 'pci_params', 'format', 'save_path'
+    )
+
+    file_path: str
+    cols: dict
+    manual: dict
+    active_tab: int
+    band_params: dict
+    pci_params: dict
+    format: str
+    save_path: str
+
+
+def _header_model(default_txt, parent):
+    """Builds a combobox model whose first row is default_txt; CSV headers follow it."""
+    model = QStandardItemModel(parent)
+    model.appendRow(QStandardItem(default_txt))
+    return model
+
+
+def _repopulate(model, headers):
+    """Replaces the header rows of a combobox model in place, keeping its default entry in row 0."""
+    model.removeRows(1, model.rowCount() - 1)
+    model.insertRows(1, len(headers))
+    for row, h in enumerate(headers, 1):
+        model.setData(model.index(row, 0), h)
+
+
+class _NoScrollCombo(QtWidgets.QComboBox):
+    """Combobox that leaves wheel events to the enclosing scroll area instead of changing selection."""
+
+    def wheelEvent(self, event):
+        event.ignore()
+
+
+class _WheelGuard(QObject):
+    """Event filter that stops wheel events from changing a widget; they propagate to its parent instead."""
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Wheel:
+            event.ignore()
+            return True
+        return super().eventFilter(obj, event)
+
+
+class _CsvScanWorker(QObject):
+    """Reads a CSV header, or the distinct values of one column, off the GUI thread."""
+
+    # Each result carries the cache entry it was requested for, so it is stored there even if superseded
+    headers_read = pyqtSignal(int, object, list)
+    bands_read = pyqtSignal(int, object, str, frozenset, int, bool)
+    bands_failed = pyqtSignal(int)
+    finished = pyqtSignal()
+
+    def __init__(self, generation, path, entry, col_name=None):
+        super().__init__()
+        self.generation = generation
+        self.path = path
+        self.entry = entry
+        self.col_name = col_name
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            if self.col_name is None:
+                self.headers_read.emit(self.generation, self.entry, _read_csv_header(self.path))
+            else:
+                result = _scan_band_values(self.path, self.col_name, lambda: self._cancelled)
+                if result is not None:
+                    self.bands_read.emit(self.generation, self.entry, self.col_name, *result)
+        except (IOError, ValueError, csv.Error):
+            # Not an empty result: the file may only be locked for now, so nothing is cached
+            if self.col_name is not None:
+                self.bands_failed.emit(self.generation)
+        finally:
+            self.finished.emit()
+
 
 class SiteSectorDialog(QtWidgets.QDialog):
     def __init__(self, iface, parent=None):
         super().__init__(parent)
         self.iface = iface
+        self._wheel_guard = _WheelGuard(self)
+        self._about_msg = None
+
+        # Results of a scan are dropped if another scan was requested after it started
+        self._scan_generation = 0
+        self._band_generation = 0
+        self._scan_jobs = {}
+
+        # (path, mtime, size) -> {'headers': list or None, 'cols': {column: band scan result}}
+        self._file_cache = OrderedDict()
+
+        # One model per default entry, shared by every combobox that starts with it
+        self._header_models = {
+            txt: _header_model(txt, self) for txt in ("-- Select Column --", "-- Use Manual --")
+        }
         
         self.setWindowTitle("Site Sector Generator")
         self.setMinimumWidth(550)
@@ -74,12 +313,12 @@ class SiteSectorDialog(QtWidgets.QDialog):
         self.input_layout.addWidget(QtWidgets.QLabel("Select File:"), 0, 0)
         self.input_layout.addWidget(self.file_widget, 0, 1)
 
-        self.combo_site = QtWidgets.QComboBox()
-        self.combo_lat = QtWidgets.QComboBox()
-        self.combo_lon = QtWidgets.QComboBox()
-        self.combo_azim = QtWidgets.QComboBox()
-        self.combo_radius = QtWidgets.QComboBox()
-        self.combo_beam = QtWidgets.QComboBox()
+        self.combo_site = _NoScrollCombo()
+        self.combo_lat = _NoScrollCombo()
+        self.combo_lon = _NoScrollCombo()
+        self.combo_azim = _NoScrollCombo()
+        self.combo_radius = _NoScrollCombo()
+        self.combo_beam = _NoScrollCombo()
 
         self.map_fields = [
             ("Site ID:", self.combo_site, "-- Select Column --"),
@@ -94,7 +333,7 @@ class SiteSectorDialog(QtWidgets.QDialog):
             row_idx = i + 1
             self.input_layout.addWidget(QtWidgets.QLabel(label), row_idx, 0)
             self.input_layout.addWidget(combo, row_idx, 1)
-            combo.addItem(default_txt)
+            combo.setModel(self._header_models[default_txt])
             
         self.layout.addWidget(self.group_input)
 
@@ -132,8 +371,8 @@ class SiteSectorDialog(QtWidgets.QDialog):
         self.layout_tab_band = QtWidgets.QVBoxLayout(self.tab_band)
         self.band_map_layout = QtWidgets.QHBoxLayout()
         
-        self.combo_band = QtWidgets.QComboBox()
-        self.combo_band.addItem("-- Select Column --")
+        self.combo_band = _NoScrollCombo()
+        self.combo_band.setModel(self._header_models["-- Select Column --"])
         self.combo_band.currentIndexChanged.connect(self.generate_dynamic_bands)
         
         self.band_map_layout.addWidget(QtWidgets.QLabel("Band/Freq Column:"))
@@ -144,26 +383,34 @@ class SiteSectorDialog(QtWidgets.QDialog):
         self.spin_opacity_band = QtWidgets.QSpinBox()
         self.spin_opacity_band.setRange(0, 100)
         self.spin_opacity_band.setValue(50)
+        self.spin_opacity_band.installEventFilter(self._wheel_guard)
         
         self.op_band_layout.addWidget(QtWidgets.QLabel("Opacity (%):")) 
         self.op_band_layout.addWidget(self.spin_opacity_band)
         self.layout_tab_band.addLayout(self.op_band_layout)
 
+        self.lbl_band_scan = QtWidgets.QLabel()
+        self.lbl_band_scan.setStyleSheet("color: #e17055;")
+        self.lbl_band_scan.setVisible(False)
+        self.layout_tab_band.addWidget(self.lbl_band_scan)
+
         self.color_container = QtWidgets.QWidget()
         self.color_layout = QtWidgets.QGridLayout(self.color_container)
         self.layout_tab_band.addWidget(self.color_container)
+        self._color_container_pos = self.layout_tab_band.indexOf(self.color_container)
         self.layout_tab_band.addStretch()
         
-        self.dynamic_color_widgets = {}
+        self._band_color_cache = {}
+        self._last_band_sig = None
 
     def _setup_pci_tab(self):
         self.layout_tab_pci = QtWidgets.QVBoxLayout(self.tab_pci)
         
         self.pci_map_layout = QtWidgets.QGridLayout()
-        self.combo_pci = QtWidgets.QComboBox()
-        self.combo_pci.addItem("-- Select Column --")
+        self.combo_pci = _NoScrollCombo()
+        self.combo_pci.setModel(self._header_models["-- Select Column --"])
         
-        self.combo_mod = QtWidgets.QComboBox()
+        self.combo_mod = _NoScrollCombo()
         self.combo_mod.addItems(["Mod 3 (RS Interference)", "Mod 6 (PSS Interference)"])
         self.combo_mod.currentIndexChanged.connect(self.update_pci_ui)
         
@@ -179,31 +426,44 @@ class SiteSectorDialog(QtWidgets.QDialog):
         self.spin_opacity_pci = QtWidgets.QSpinBox()
         self.spin_opacity_pci.setRange(0, 100)
         self.spin_opacity_pci.setValue(60)
+        self.spin_opacity_pci.installEventFilter(self._wheel_guard)
         
         self.pci_color_layout.addWidget(QtWidgets.QLabel("Opacity (%):"), 0, 0)
         self.pci_color_layout.addWidget(self.spin_opacity_pci, 0, 1)
 
-        self.pci_colors = []
-        default_pci_colors = [Qt.red, Qt.yellow, Qt.blue, Qt.green, Qt.magenta, Qt.cyan]
-        
+        # The Modulo color buttons are built the first time the tab is shown
+        self._pci_rows = []
+        # Hex colors kept in step with the buttons so get_inputs needs no PyQt round trips
+        self._pci_color_cache = [QColor(c).name() for c in _DEFAULT_PCI_COLORS]
+        self._pci_built = False
+        self.tabs.currentChanged.connect(self._ensure_pci_built)
+            
+        self.layout_tab_pci.addWidget(self.pci_color_group)
+        self.layout_tab_pci.addStretch()
+
+    def _ensure_pci_built(self, index):
+        if index != 1 or self._pci_built:
+            return
+
         for i in range(6):
             btn = QgsColorButton()
-            btn.setColor(default_pci_colors[i])
+            btn.setColor(_DEFAULT_PCI_COLORS[i])
+            btn.colorChanged.connect(lambda c, i=i: self._pci_color_cache.__setitem__(i, c.name()))
             lbl = QtWidgets.QLabel(f"Mod {i}:")
             
             row, col = (i // 2) + 1, (i % 2) * 2
             self.pci_color_layout.addWidget(lbl, row, col)
             self.pci_color_layout.addWidget(btn, row, col + 1)
-            self.pci_colors.append(btn)
-            
-        self.layout_tab_pci.addWidget(self.pci_color_group)
-        self.layout_tab_pci.addStretch()
+            self._pci_rows.append((lbl, btn))
+
+        self._pci_built = True
+        self.update_pci_ui()
 
     def _setup_export_group(self):
         self.group_output = QgsCollapsibleGroupBox("Output Export", self.scroll_content)
         self.out_layout = QtWidgets.QGridLayout(self.group_output)
         
-        self.combo_format = QtWidgets.QComboBox()
+        self.combo_format = _NoScrollCombo()
         self.combo_format.addItems(["ESRI Shapefile (.shp)", "MapInfo (.tab)", "Google Earth (.kml)"])
         self.combo_format.currentIndexChanged.connect(self.update_save_filter)
         
@@ -235,128 +495,176 @@ class SiteSectorDialog(QtWidgets.QDialog):
 
     def update_pci_ui(self):
         """Toggles visibility of Modulo color pickers based on selected mode."""
-        mod_idx = self.combo_mod.currentIndex()
-        for i in range(6):
-            btn = self.pci_colors[i]
-            lbl_item = self.pci_color_layout.itemAtPosition((i // 2) + 1, (i % 2) * 2)
-            if lbl_item and lbl_item.widget():
-                show_it = (mod_idx == 0 and i < 3) or (mod_idx == 1 and i < 6)
-                btn.setVisible(show_it)
-                lbl_item.widget().setVisible(show_it)
+        if not self._pci_built:
+            return
+        limit = 3 if self.combo_mod.currentIndex() == 0 else 6
+        for i, (lbl, btn) in enumerate(self._pci_rows):
+            show_it = i < limit
+            btn.setVisible(show_it)
+            lbl.setVisible(show_it)
 
     def show_about(self):
-        msg = QMessageBox(self.iface.mainWindow())
-        msg.setWindowTitle(self.tr("About"))
-        msg.setIcon(QMessageBox.Information)
-        msg.setTextFormat(Qt.RichText)
-        
-        about_html = (
-            "<h3>Site Sector Generator</h3>"
-            "<b>Version:</b> 1.2.0<br>"
-            "<b>Author:</b> Jujun Junaedi<br><br>"
-            "<b>☕ Support & Donate:</b><br>"
-            "If this tool saves you hours of work, consider buying me a coffee!<br>"
-            "• <b>Global:</b> Buy Me a Coffee (buymeacoffee.com/juneth)<br>"
-            "• <b>Indonesia:</b> OVO / GoPay (081510027058)<br><br>"
-            "<div style='background-color: #e8f4f8; padding: 10px; border-radius: 5px; text-align: center; color: #2d98da; border: 1px solid #bdc3c7;'>"
-            "<b>💡 PRO TIP FOR SHARING 💡</b><br>"
-            "<span style='font-size: 11px;'>"
-            "To ensure your colleagues get the latest version without bugs, please share the <b>Official QGIS Plugin Link</b> or <b>GitHub Link</b> instead of raw ZIP files.<br><br>"
-            "<i>Biar rekan kerjamu selalu dapat versi terbaru yang bebas error, yuk biasakan share link resmi QGIS/GitHub, bukan bagi-bagi file ZIP mentahan 😉</i>"
-            "</span>"
-            "</div><br><hr>"
-            "<p align='center' style='color: #636e72; font-size: 11px;'>"
-            "<i>\"Thanks for Taink | Cemot | Bolu | Nara. ❤️❤️❤️❤️\"</i></p>"
-        )
-        msg.setText(about_html)
-        msg.exec_()
+        if self._about_msg is None:
+            # Owned by the dialog so the reused box goes away with it
+            msg = QMessageBox(self)
+            msg.setWindowTitle(self.tr("About"))
+            msg.setIcon(QMessageBox.Information)
+            msg.setTextFormat(Qt.RichText)
+            msg.setText(_ABOUT_HTML)
+            self._about_msg = msg
+        self._about_msg.exec_()
 
     def update_save_filter(self, idx):
         filters = ["Shapefile (*.shp)", "MapInfo (*.tab)", "Google Earth KML (*.kml)"]
         self.save_widget.setFilter(filters[idx])
 
     def load_headers(self, path):
-        """Reads CSV headers and populates comboboxes without triggering UI updates."""
-        if not os.path.exists(path): 
+        """Starts a background read of the CSV header; the comboboxes are filled by _apply_headers."""
+        self._scan_generation += 1
+        self._band_generation += 1
+        if (entry := self._cache_entry(path)) is None: 
             return
-            
-        try:
-            with open(path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.reader(f)
-                headers = next(reader)
-                
-                # Use blockSignals to prevent rendering crashes during bulk updates
-                for _, combo, default_txt in self.map_fields:
-                    combo.blockSignals(True)
-                    combo.clear()
-                    combo.addItem(default_txt)
-                    combo.addItems(headers)
-                    combo.blockSignals(False)
-                    
-                for combo in [self.combo_band, self.combo_pci]:
-                    combo.blockSignals(True)
-                    combo.clear()
-                    combo.addItem("-- Select Column --")
-                    combo.addItems(headers)
-                    combo.blockSignals(False)
-                    
-        except IOError: 
-            pass
+
+        if entry['headers'] is not None:
+            self._apply_headers(self._scan_generation, entry['headers'])
+            return
+        self._start_scan(_CsvScanWorker(self._scan_generation, path, entry))
+
+    def _on_headers_read(self, generation, entry, headers):
+        # Cached even when superseded: the entry is keyed by the file version that was read
+        entry['headers'] = headers
+        self._apply_headers(generation, headers)
+
+    def _apply_headers(self, generation, headers):
+        """Refills the shared column models from a finished header scan."""
+        if generation != self._scan_generation:
+            return
+
+        # Comboboxes left on a header fall back to their default entry as its row goes away
+        for model in self._header_models.values():
+            _repopulate(model, headers)
 
     def generate_dynamic_bands(self):
-        """Dynamically builds color pickers based on unique bands found in the dataset."""
+        """Starts a background scan of the selected band column; the pickers are rebuilt when it finishes."""
         col_name = self.combo_band.currentText()
         file_path = self.file_widget.filePath()
-        
-        while self.color_layout.count():
-            item = self.color_layout.takeAt(0)
-            if item.widget(): 
-                item.widget().deleteLater()
-                
-        self.dynamic_color_widgets.clear()
-
-        if col_name == "-- Select Column --" or not os.path.exists(file_path): 
-            return
+        self._band_generation += 1
 
-        unique_bands = set()
-        try:
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if val := row.get(col_name):
-                        if str(val).strip():
-                            unique_bands.add(str(val).strip())
-        except IOError: 
+        if col_name == "-- Select Column --" or (entry := self._cache_entry(file_path)) is None: 
+            self._clear_band_widgets()
             return
 
-        def extract_freq(b):
-            nums = re.findall(r'\d+', str(b))
-            return max(int(n) for n in nums) if nums else 99999
+        if (cached := entry['cols'].get(col_name)) is not None:
+            self._build_band_widgets(self._band_generation, *cached)
+            return
+        self._start_scan(_CsvScanWorker(self._band_generation, file_path, entry, col_name))
+
+    def _clear_band_widgets(self):
+        # Swap in a fresh container: deleting the old one drops every picker in a single C++ pass
+        if self.color_layout.count():
+            self.layout_tab_band.removeWidget(self.color_container)
+            self.color_container.deleteLater()
+            self.color_container = QtWidgets.QWidget()
+            self.color_layout = QtWidgets.QGridLayout(self.color_container)
+            self.layout_tab_band.insertWidget(self._color_container_pos, self.color_container)
+
+        self._band_color_cache.clear()
+        self.lbl_band_scan.setVisible(False)
+        self._last_band_sig = None
+
+    def _on_bands_read(self, generation, entry, col_name, unique_bands, rows_read, truncated):
+        # Cached even when superseded, like _on_headers_read
+        entry['cols'][col_name] = (unique_bands, rows_read, truncated)
+        self._build_band_widgets(generation, unique_bands, rows_read, truncated)
+
+    def _on_bands_failed(self, generation):
+        # Clear the pickers rather than leave another column's bands on screen
+        if generation == self._band_generation:
+            self._clear_band_widgets()
+
+    def _build_band_widgets(self, generation, unique_bands, rows_read, truncated):
+        """Builds color pickers for the unique bands found by a finished band scan."""
+        if generation != self._band_generation:
+            return
 
-        sorted_bands = sorted(list(unique_bands), key=extract_freq)
+        # Decorate-sort-undecorate; equal frequencies fall back to the label, so the order is stable
+        keyed = [(extract_numeric_freq(b), b) for b in unique_bands]
+        keyed.sort()
+        sorted_bands = [b for _, b in keyed]
+
+        # Same file, column and bands as the pickers on screen: keep them and any colors the user chose
+        sig = (self.file_widget.filePath(), self.combo_band.currentText(), tuple(sorted_bands))
+        if sig != self._last_band_sig:
+            self._clear_band_widgets()
+            self._add_band_widgets(sorted_bands)
+            self._last_band_sig = sig
+
+        if truncated:
+            self.lbl_band_scan.setText(
+                f"Scan truncated after {rows_read:,} rows; bands found later are drawn in grey."
+            )
+        self.lbl_band_scan.setVisible(truncated)
+
+    def _add_band_widgets(self, sorted_bands):
         default_colors = [Qt.red, Qt.green, Qt.blue, Qt.magenta, Qt.cyan, Qt.yellow, Qt.darkGreen, Qt.darkBlue]
 
         for i, band in enumerate(sorted_bands):
             lbl = QtWidgets.QLabel(f"Band: {band}")
             btn = QgsColorButton()
-            btn.setColor(default_colors[i % len(default_colors)])
+            color = QColor(default_colors[i % len(default_colors)])
+            btn.setColor(color)
+            btn.colorChanged.connect(lambda c, b=band: self._band_color_cache.__setitem__(b, c.name()))
             
             row, col = i // 2, (i % 2) * 2
             self.color_layout.addWidget(lbl, row, col)
             self.color_layout.addWidget(btn, row, col + 1)
-            self.dynamic_color_widgets[band] = btn
+            self._band_color_cache[band] = color.name()
 
-    def get_inputs(self):
-        """Collects all UI inputs and configurations into a structured dictionary."""
-        final_band_colors = {
-            band: btn.color().name() 
-            for band, btn in self.dynamic_color_widgets.items()
-        }
-        pci_col_hex = [btn.color().name() for btn in self.pci_colors]
+    def _cache_entry(self, path):
+        """Returns the scan cache entry for the current version of path, or None if it cannot be stat'ed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        key = (path, st.st_mtime, st.st_size)
+        entry = self._file_cache.get(key)
+        if entry is None:
+            entry = self._file_cache[key] = {'headers': None, 'cols': {}}
+            if len(self._file_cache) > _SCAN_CACHE_SIZE:
+                self._file_cache.popitem(last=False)
+        else:
+            self._file_cache.move_to_end(key)
+        return entry
+
+    def _start_scan(self, worker):
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        worker.headers_read.connect(self._on_headers_read)
+        worker.bands_read.connect(self._on_bands_read)
+        worker.bands_failed.connect(self._on_bands_failed)
+        # Direct connection: done() may be blocking the GUI thread in thread.wait()
+        worker.finished.connect(thread.quit, Qt.DirectConnection)
+        thread.started.connect(worker.run)
+        thread.finished.connect(lambda: self._scan_jobs.pop(thread, None))
+        thread.finished.connect(thread.deleteLater)
+        self._scan_jobs[thread] = worker
+        thread.start()
+
+    def done(self, result):
+        """Waits for pending scans (cancelling them on reject) so get_inputs sees their results."""
+        for thread, worker in list(self._scan_jobs.items()):
+            if result != QtWidgets.QDialog.Accepted:
+                worker.cancel()
+            thread.wait()
+        QCoreApplication.sendPostedEvents()
+        super().done(result)
 
-        return {
-            "file_path": self.file_widget.filePath(),
-            "cols": {
+    def get_inputs(self):
+        """Collects all UI inputs and configurations into a SiteSectorInputs snapshot."""
+        return SiteSectorInputs(
+            file_path=self.file_widget.filePath(),
+            cols={
                 "site": self.combo_site.currentText(), 
                 "lat": self.combo_lat.currentText(),
                 "lon": self.combo_lon.currentText(), 
@@ -366,20 +674,20 @@ class SiteSectorDialog(QtWidgets.QDialog):
                 "band": self.combo_band.currentText(), 
                 "pci": self.combo_pci.currentText()
             },
-            "manual": {
+            manual={
                 "radius": float(self.txt_radius.text()) if self.txt_radius.text() else 200.0, 
                 "beam": float(self.txt_beam.text()) if self.txt_beam.text() else 65.0
             },
-            "active_tab": self.tabs.currentIndex(), 
-            "band_params": {
-                "colors": final_band_colors, 
+            active_tab=self.tabs.currentIndex(), 
+            band_params={
+                "colors": dict(self._band_color_cache), 
                 "opacity": self.spin_opacity_band.value()
             },
-            "pci_params": {
+            pci_params={
                 "mod_type": [3, 6][self.combo_mod.currentIndex()],
-                "colors": pci_col_hex,
+                "colors": list(self._pci_color_cache),
                 "opacity": self.spin_opacity_pci.value()
             },
-            "format": self.combo_format.currentText(),
-            "save_path": self.save_widget.filePath()
-        }
\ No newline at end of file
+            format=self.combo_format.currentText(),
+            save_path=self.save_widget.filePath()
+        )
\ No newline at end of file